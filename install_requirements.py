@@ -6,14 +6,14 @@ Installation script for Spotify to YouTube Downloader
 import subprocess
 import sys
 
-def install_package(package):
-    """Install a package using pip"""
+def install_packages(packages):
+    """Install all packages using a single pip invocation"""
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-        print(f"Successfully installed {package}")
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *packages])
+        print(f"Successfully installed {len(packages)} packages")
         return True
     except subprocess.CalledProcessError:
-        print(f"Failed to install {package}")
+        print("Package installation failed")
         return False
 
 def main():
@@ -29,13 +29,10 @@ def main():
         "yt-dlp"
     ]
     
-    success_count = 0
-    for package in packages:
-        if install_package(package):
-            success_count += 1
-    
+    success = install_packages(packages)
+
     print("\n" + "=" * 60)
-    if success_count == len(packages):
+    if success:
         print("All packages installed successfully!")
         print("\nNext steps:")
         print("1. Copy env_template.txt to .env")
@@ -43,10 +40,8 @@ def main():
         print("3. Run: python spotify_to_youtube.py")
         print("4. The script will automatically download songs after processing!")
     else:
-        print(f"{len(packages) - success_count} packages failed to install")
-        print("Please try installing them manually:")
-        for package in packages:
-            print(f"   pip install {package}")
+        print("Please try installing the packages manually:")
+        print('\n'.join(f"   pip install {package}" for package in packages))
 
 if __name__ == "__main__":
     main()
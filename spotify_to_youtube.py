@@ -14,24 +14,34 @@ A fully automated application that:
 
 import os
 import sys
+import json
 import subprocess
-import importlib
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple, List
 
 # Package management functions
-def install_package(package: str) -> bool:
-    """Install a Python package using pip"""
+def install_packages(packages: List[str]) -> bool:
+    """Install Python packages using a single pip invocation
+
+    Installing everything in one call spawns one pip process and runs the
+    dependency resolver once, instead of once per package.
+    """
+    if not packages:
+        return True
+
     try:
-        print(f"Installing {package}...")
+        print(f"Installing: {', '.join(packages)}...")
         subprocess.check_call(
-            [sys.executable, "-m", "pip", "install", package],
+            [sys.executable, "-m", "pip", "install", *packages],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL
         )
-        print(f"Successfully installed {package}")
+        print(f"Successfully installed {len(packages)} package(s)")
         return True
     except subprocess.CalledProcessError:
-        print(f"Failed to install {package}")
+        print(f"Failed to install: {', '.join(packages)}")
         return False
 
 def check_and_install_packages() -> bool:
@@ -49,50 +59,63 @@ def check_and_install_packages() -> bool:
     
     missing_packages = []
     
+    # find_spec only looks the module up without executing it, so this
+    # check skips the cost of actually importing pandas and friends here
+    status_lines = []
     for import_name, package_name in required_packages.items():
-        try:
-            importlib.import_module(import_name)
-            print(f"{package_name} is already installed")
-        except ImportError:
-            print(f"{package_name} is missing")
+        if importlib.util.find_spec(import_name) is not None:
+            status_lines.append(f"{package_name} is already installed")
+        else:
+            status_lines.append(f"{package_name} is missing")
             missing_packages.append(package_name)
+    print('\n'.join(status_lines))
     
     if missing_packages:
         print(f"\nInstalling {len(missing_packages)} missing packages...")
-        success_count = 0
-        
-        for package in missing_packages:
-            if install_package(package):
-                success_count += 1
-        
-        print(f"\nPackage installation summary:")
-        print(f"  Successfully installed: {success_count}")
-        print(f"  Failed to install: {len(missing_packages) - success_count}")
-        
-        if success_count < len(missing_packages):
+
+        if not install_packages(missing_packages):
             print("\nSome packages failed to install. Please install them manually:")
-            for package in missing_packages:
-                print(f"  pip install {package}")
+            print('\n'.join(f"  pip install {package}" for package in missing_packages))
             return False
-        
+
+        # Verify every previously missing import is now actually available;
+        # invalidate finder caches so freshly installed packages are seen
+        importlib.invalidate_caches()
+        still_missing = [
+            package_name
+            for import_name, package_name in required_packages.items()
+            if package_name in missing_packages and importlib.util.find_spec(import_name) is None
+        ]
+
+        if still_missing:
+            print("\nSome packages failed to install. Please install them manually:")
+            print('\n'.join(f"  pip install {package}" for package in still_missing))
+            return False
+
         print("All required packages are now installed!")
         return True
     else:
         print("All required packages are already installed!")
         return True
 
+def check_dependencies_fast() -> bool:
+    """Quickly check that every dependency resolves, without remediation
+
+    This is the common case after the first run; it avoids paying the
+    install/version machinery on every startup.
+    """
+    required = ('spotipy', 'pandas', 'googleapiclient', 'tqdm', 'dotenv', 'yt_dlp')
+    return all(importlib.util.find_spec(name) is not None for name in required)
+
 def check_yt_dlp() -> bool:
     """Check if yt-dlp is installed and install it if missing"""
     try:
-        result = subprocess.run(
-            ['yt-dlp', '--version'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        print(f"yt-dlp is installed (version: {result.stdout.strip()})")
+        # Importing the module is far cheaper than spawning a yt-dlp
+        # process, and works even when the console script is not on PATH
+        import yt_dlp
+        print(f"yt-dlp is installed (version: {yt_dlp.version.__version__})")
         return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    except ImportError:
         print("yt-dlp is not installed")
         print("Installing yt-dlp...")
         try:
@@ -120,19 +143,58 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Maximum subrequests the Google API client allows per BatchHttpRequest
+YOUTUBE_BATCH_SIZE = 50
+
+# Persistent cache of YouTube search results, keyed by search query.
+# Re-running the tool on overlapping playlists (or playlists with repeated
+# tracks) then costs zero API quota for the tracks already seen.
+YOUTUBE_CACHE_FILE = '.yt_cache.json'
+_youtube_cache = {}
+_youtube_cache_lock = threading.Lock()
+
+def load_youtube_cache() -> None:
+    """Load previously cached YouTube search results from disk"""
+    global _youtube_cache
+    try:
+        with open(YOUTUBE_CACHE_FILE, 'r', encoding='utf-8') as f:
+            _youtube_cache = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        _youtube_cache = {}
+
+def save_youtube_cache() -> None:
+    """Persist the YouTube search cache to disk"""
+    with _youtube_cache_lock:
+        try:
+            with open(YOUTUBE_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(_youtube_cache, f)
+        except OSError as e:
+            print(f"Warning: could not save YouTube search cache: {e}")
+
+# YouTube API clients, one per thread. Building a client parses the
+# discovery document and sets up TLS, so it should happen once per thread
+# rather than once per search. googleapiclient services are not safe to
+# share across threads, hence threading.local instead of a single global.
+_youtube_clients = threading.local()
+
+def get_youtube_client():
+    """Return a YouTube API client for the current thread, building it on first use"""
+    if not hasattr(_youtube_clients, 'service'):
+        _youtube_clients.service = build(
+            'youtube', 'v3',
+            developerKey=API_KEY,
+            cache_discovery=False
+        )
+    return _youtube_clients.service
+
+# Characters not allowed in folder names, each mapped to '_' so
+# sanitize_filename can replace them all in one translate pass
+_INVALID_FILENAME_CHARS = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
 # Utility functions
 def sanitize_filename(filename: str) -> str:
     """Convert playlist name to a valid folder name"""
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-    
-    filename = filename.strip(' .')
-    
-    if len(filename) > 100:
-        filename = filename[:100]
-    
-    return filename
+    return filename.translate(_INVALID_FILENAME_CHARS).strip(' .')[:100]
 
 def check_environment() -> bool:
     """Check if all required environment variables are set"""
@@ -267,16 +329,14 @@ def export_spotify_playlist(playlist_url: str) -> Tuple[Optional[pd.DataFrame],
             print(f"Album: {album_name}")
             print(f"Total tracks: {album['total_tracks']}")
             
-            # Extract track information
-            track_data = []
+            # Extract track information into parallel column lists
+            names = []
+            artists = []
             for track in album['tracks']['items']:
-                track_info = {
-                    'Track Name': track['name'],
-                    'Artist Name(s)': ', '.join([artist['name'] for artist in track['artists']])
-                }
-                track_data.append(track_info)
-            
-            return pd.DataFrame(track_data), album_name
+                names.append(track['name'])
+                artists.append(', '.join(artist['name'] for artist in track['artists']))
+
+            return pd.DataFrame({'Track Name': names, 'Artist Name(s)': artists}), album_name
             
         except Exception as e:
             print(f"Error: {e}")
@@ -287,31 +347,57 @@ def export_spotify_playlist(playlist_url: str) -> Tuple[Optional[pd.DataFrame],
         playlist_id = playlist_url.split('playlist/')[1].split('?')[0]
         
         try:
-            playlist = sp.playlist(playlist_id)
+            playlist = sp.playlist(playlist_id, fields='name,tracks(total)')
             playlist_name = playlist['name']
+            total = playlist['tracks']['total']
             print(f"Playlist: {playlist_name}")
-            print(f"Total tracks: {playlist['tracks']['total']}")
-            
-            tracks = []
-            results = sp.playlist_tracks(playlist_id)
-            tracks.extend(results['items'])
-            
-            # Handle playlists with more than 100 songs
-            while results['next']:
-                results = sp.next(results)
-                tracks.extend(results['items'])
-            
-            # Extract track information
-            track_data = []
-            for track in tracks:
-                if track['track']:
-                    track_info = {
-                        'Track Name': track['track']['name'],
-                        'Artist Name(s)': ', '.join([artist['name'] for artist in track['track']['artists']])
-                    }
-                    track_data.append(track_info)
-            
-            return pd.DataFrame(track_data), playlist_name
+            print(f"Total tracks: {total}")
+
+            # Only the track name and artist names are ever used, so ask
+            # the API for just those keys - full track objects carry album
+            # art, market lists, external IDs and more, ~10x the bytes
+            page_fields = 'items(track(name,artists(name)))'
+
+            # Extract track information into parallel column lists as each
+            # page arrives, instead of buffering every raw page item first
+            names = []
+            artists = []
+
+            def collect_page(page):
+                for item in page['items']:
+                    track = item['track']
+                    if track:
+                        names.append(track['name'])
+                        artists.append(', '.join(artist['name'] for artist in track['artists']))
+
+            collect_page(sp.playlist_items(
+                playlist_id,
+                fields=page_fields,
+                limit=100,
+                additional_types=('track',)
+            ))
+
+            # Handle playlists with more than 100 songs - the total is known
+            # from the first response, so remaining pages sit at fixed offsets
+            # and can be fetched concurrently instead of walking sp.next()
+            offsets = range(100, total, 100)
+            if offsets:
+                with ThreadPoolExecutor(max_workers=min(8, len(offsets))) as executor:
+                    pages = executor.map(
+                        lambda offset: sp.playlist_items(
+                            playlist_id,
+                            fields=page_fields,
+                            offset=offset,
+                            limit=100,
+                            additional_types=('track',)
+                        ),
+                        offsets
+                    )
+                    # executor.map preserves offset order
+                    for page in pages:
+                        collect_page(page)
+
+            return pd.DataFrame({'Track Name': names, 'Artist Name(s)': artists}), playlist_name
             
         except Exception as e:
             print(f"Error: {e}")
@@ -320,31 +406,110 @@ def export_spotify_playlist(playlist_url: str) -> Tuple[Optional[pd.DataFrame],
         print("Invalid URL format. Please provide a Spotify playlist or album URL.")
         return None, None
 
-def get_youtube_link(song_name: str, artist: Optional[str] = None, keyword: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
-    """Search YouTube for song and return first result with video title
-    
+def build_search_query(song_name: str, artist: Optional[str] = None, keyword: Optional[str] = None) -> str:
+    """Build the YouTube search query for a song
+
     Args:
         song_name: Name of the song to search for
         artist: Optional artist name
         keyword: Optional keyword to append to search (e.g., 'Visualizer', 'Lyrics', 'Audio')
-    
+
     Returns:
-        Tuple of (YouTube URL, Video Title)
+        The search query string
     """
-    # Build search query
     query = f"{song_name}"
     if artist:
         query += f" {artist}"
-    
+
     # Add keyword if provided, otherwise default to 'lyrics'
     if keyword:
         query += f" {keyword}"
     else:
         query += " lyrics"
 
+    return query
+
+def search_youtube_batch(tracks: List[Tuple[str, str]], keyword: Optional[str] = None) -> List[Tuple[Optional[str], Optional[str]]]:
+    """Search YouTube for a batch of tracks using a single multiplexed HTTP request
+
+    Args:
+        tracks: List of (song name, artist) pairs, at most YOUTUBE_BATCH_SIZE entries
+        keyword: Optional keyword to append to each search
+
+    Returns:
+        List of (YouTube URL, Video Title) tuples in the same order as tracks
+    """
+    results = [(None, None)] * len(tracks)
+    queries = [build_search_query(song_name, artist, keyword) for song_name, artist in tracks]
+
+    # Serve repeated queries from the cache; only misses hit the API
+    with _youtube_cache_lock:
+        misses = []
+        for index, query in enumerate(queries):
+            cached = _youtube_cache.get(query)
+            if cached is not None:
+                results[index] = tuple(cached)
+            else:
+                misses.append(index)
+
+    if not misses:
+        return results
+
+    def callback(request_id, response, exception):
+        index = int(request_id)
+        if exception is not None:
+            print(f"Error searching for '{tracks[index][0]}': {exception}")
+            return
+        if response['items']:
+            video_id = response['items'][0]['id']['videoId']
+            video_title = response['items'][0]['snippet']['title']
+            results[index] = (f"https://www.youtube.com/watch?v={video_id}", video_title)
+        with _youtube_cache_lock:
+            _youtube_cache[queries[index]] = list(results[index])
+
+    youtube = get_youtube_client()
+    batch = youtube.new_batch_http_request(callback=callback)
+    for index in misses:
+        song_name, artist = tracks[index]
+        batch.add(
+            youtube.search().list(
+                q=queries[index],
+                part="snippet",
+                type="video",
+                maxResults=1,
+                videoCategoryId=10  # Music category
+            ),
+            request_id=str(index)
+        )
+
     try:
-        youtube = build('youtube', 'v3', developerKey=API_KEY)
-        
+        batch.execute()
+    except Exception as e:
+        print(f"Error executing batch search: {e}")
+
+    return results
+
+def get_youtube_link(song_name: str, artist: Optional[str] = None, keyword: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
+    """Search YouTube for song and return first result with video title
+
+    Args:
+        song_name: Name of the song to search for
+        artist: Optional artist name
+        keyword: Optional keyword to append to search (e.g., 'Visualizer', 'Lyrics', 'Audio')
+
+    Returns:
+        Tuple of (YouTube URL, Video Title)
+    """
+    query = build_search_query(song_name, artist, keyword)
+
+    with _youtube_cache_lock:
+        cached = _youtube_cache.get(query)
+    if cached is not None:
+        return tuple(cached)
+
+    try:
+        youtube = get_youtube_client()
+
         request = youtube.search().list(
             q=query,
             part="snippet",
@@ -354,11 +519,15 @@ def get_youtube_link(song_name: str, artist: Optional[str] = None, keyword: Opti
         )
         response = request.execute()
 
+        result = (None, None)
         if response['items']:
             video_id = response['items'][0]['id']['videoId']
             video_title = response['items'][0]['snippet']['title']
-            youtube_url = f"https://www.youtube.com/watch?v={video_id}"
-            return youtube_url, video_title
+            result = (f"https://www.youtube.com/watch?v={video_id}", video_title)
+
+        with _youtube_cache_lock:
+            _youtube_cache[query] = list(result)
+        return result
     except Exception as e:
         print(f"Error searching for '{query}': {e}")
 
@@ -386,48 +555,61 @@ def download_songs(links: List[str], playlist_folder: str) -> bool:
     print(f"Downloading to folder: {playlist_folder}")
     print("This may take a while depending on the number of songs...")
     
-    # Change to the playlist folder
-    original_dir = os.getcwd()
-    os.chdir(playlist_folder)
-    
     try:
-        # Create the yt-dlp command using Python module
-        cmd = [
-            sys.executable,
-            '-m', 'yt_dlp',
-            '-f', 'bestaudio[ext=m4a]',
-            '--output', '%(title)s.%(ext)s'
-        ]
-        cmd.extend(links)
-        
-        print(f"\nExecuting command: {' '.join(cmd[:7])}... [and {len(links)} URLs]")
+        # Imported here rather than at module scope because check_yt_dlp
+        # may have installed yt-dlp earlier in this same run
+        from yt_dlp import YoutubeDL
+
+        # 'paths' sends output to the playlist folder without os.chdir,
+        # which is process-global and would break concurrent downloads
+        ydl_opts = {
+            'format': 'bestaudio[ext=m4a]',
+            'outtmpl': '%(title)s.%(ext)s',
+            'paths': {'home': playlist_folder},
+            # Parallel HLS/DASH fragment fetches within each download
+            'concurrent_fragment_downloads': 8,
+        }
+
+        def download_one(link: str) -> bool:
+            try:
+                # YoutubeDL instances are not thread-safe, so each
+                # download gets its own
+                with YoutubeDL(ydl_opts) as ydl:
+                    return ydl.download([link]) == 0
+            except Exception as e:
+                print(f"Failed to download {link}: {e}")
+                return False
+
+        # Downloads are network-bound, so several workers together
+        # saturate the downlink
+        num_workers = min(8, len(links))
+        print(f"\nDownloading {len(links)} songs with {num_workers} parallel workers")
         print("=" * 60)
-        
-        # Execute the download command
-        subprocess.run(cmd, check=True)
-        
+
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            outcomes = list(executor.map(download_one, links))
+
+        failed = len(links) - sum(outcomes)
+        if failed:
+            print(f"Download failed for {failed} of {len(links)} songs")
+            return False
+
         print("=" * 60)
         print("Download completed successfully!")
-        print(f"Songs downloaded to: {os.path.abspath('.')}")
-        
+        print(f"Songs downloaded to: {os.path.abspath(playlist_folder)}")
+
         # List all downloaded files
-        downloaded_files = [f for f in os.listdir('.') if f.endswith('.m4a')]
+        downloaded_files = [f for f in os.listdir(playlist_folder) if f.endswith('.m4a')]
         if downloaded_files:
+            # One write instead of one syscall per file
             print(f"\nDownloaded {len(downloaded_files)} songs:")
-            for file in downloaded_files:
-                print(f"  - {file}")
-        
+            print('\n'.join(f"  - {file}" for file in downloaded_files))
+
         return True
-        
-    except subprocess.CalledProcessError as e:
-        print(f"Download failed with error: {e}")
-        return False
+
     except KeyboardInterrupt:
         print("\nDownload interrupted by user")
         return False
-    finally:
-        # Return to original directory
-        os.chdir(original_dir)
 
 def process_youtube_playlist(playlist_url: str) -> bool:
     """Process a YouTube playlist directly without YouTube search
@@ -455,8 +637,7 @@ def process_youtube_playlist(playlist_url: str) -> bool:
     
     print(f"Successfully extracted {len(video_urls)} videos!")
     print(f"\nFirst few videos:")
-    for i, url in enumerate(video_urls[:5], 1):
-        print(f"  {i}. {url}")
+    print('\n'.join(f"  {i}. {url}" for i, url in enumerate(video_urls[:5], 1)))
     
     if len(video_urls) > 5:
         print(f"  ... and {len(video_urls) - 5} more")
@@ -505,15 +686,42 @@ def process_playlist(playlist_url: str, search_keyword: Optional[str] = None) ->
         print("\nUsing default YouTube search keyword: 'lyrics'")
     
     print("\nStarting YouTube search...")
-    
-    # Add progress bar for visual feedback
-    tqdm.pandas(desc="Searching YouTube")
-    
-    # Create YouTube links and video titles
-    df[['YouTube Link', 'YouTube Video Title']] = df.progress_apply(
-        lambda row: pd.Series(get_youtube_link(row['Track Name'], row['Artist Name(s)'], search_keyword)),
-        axis=1
-    )
+
+    # Reuse results cached by earlier runs
+    load_youtube_cache()
+
+    # Search YouTube in batches of up to 50 tracks - each batch is a single
+    # multiplexed HTTP request, and batches run concurrently across threads
+    tasks = list(zip(df['Track Name'], df['Artist Name(s)']))
+    chunks = [tasks[i:i + YOUTUBE_BATCH_SIZE] for i in range(0, len(tasks), YOUTUBE_BATCH_SIZE)]
+    max_workers = min(8, len(chunks))
+
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for chunk_results in tqdm(
+            executor.map(lambda chunk: search_youtube_batch(chunk, search_keyword), chunks),
+            total=len(chunks),
+            desc="Searching YouTube"
+        ):
+            results.extend(chunk_results)
+
+    # Persist the cache so re-runs skip these queries
+    save_youtube_cache()
+
+    # Create YouTube links and video titles - plain column assignment from
+    # lists, no intermediate DataFrame or per-row Series construction.
+    # The found links are gathered in the same pass, so the success rate
+    # and download list below need no extra pandas column scans.
+    urls = []
+    titles = []
+    links = []
+    for url, title in results:
+        urls.append(url)
+        titles.append(title)
+        if url:
+            links.append(url)
+    df['YouTube Link'] = urls
+    df['YouTube Video Title'] = titles
     
     # Check results
     print("\nCompleted searches!")
@@ -525,12 +733,10 @@ def process_playlist(playlist_url: str, search_keyword: Optional[str] = None) ->
     print(f"\nSaved results to {final_output}")
     
     # Show completion message
-    success_rate = df['YouTube Link'].notnull().mean()
+    success_rate = len(links) / len(results) if results else 0
     print(f"Success rate: {success_rate:.0%}")
-    
+
     # Generate download command and execute
-    links = df[df['YouTube Link'].notna()]['YouTube Link'].tolist()
-    
     if links:
         command = 'yt-dlp -f "bestaudio[ext=m4a]" --output "%(title)s.%(ext)s" \\\n'
         command += " \\\n".join([f'"{link}"' for link in links])
@@ -554,19 +760,22 @@ def main():
     print("Spotify/YouTube Playlist Downloader")
     print("=" * 50)
     
-    # Check and install required packages
-    if not check_and_install_packages():
-        print("Failed to install required packages. Please try again.")
-        return
-    
+    # Only enter the install/remediation path when something is actually
+    # missing - the fast check is a handful of spec lookups
+    if not check_dependencies_fast():
+        # Check and install required packages
+        if not check_and_install_packages():
+            print("Failed to install required packages. Please try again.")
+            return
+
+        # Check if yt-dlp is available
+        if not check_yt_dlp():
+            return
+
     # Check environment variables
     if not check_environment():
         return
     
-    # Check if yt-dlp is available
-    if not check_yt_dlp():
-        return
-    
     # Get playlist URL from user
     print("\n" + "=" * 70)
     print("Enter your Spotify or YouTube playlist URL")